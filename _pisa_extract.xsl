@@ -0,0 +1,73 @@
+<?xml version="1.0"?>
+<!-- TSV extraction of a PISA interfaces dump for pisa_interface_stats.py.
+
+     One line per record, first field is the kind:
+       I  int_area  stab_en  int_solv_en  pvalue  chain-ids (space-joined)
+       R  chain  name  seq_num  asa  bsa  solv_en
+       H  chain-1  seqnum-1  chain-2  seqnum-2
+       S  chain-1  seqnum-1  chain-2  seqnum-2
+-->
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:output method="text" encoding="UTF-8"/>
+
+  <xsl:template match="/">
+    <xsl:for-each select="//interface">
+      <xsl:text>I&#9;</xsl:text>
+      <xsl:value-of select="normalize-space(int_area)"/>
+      <xsl:text>&#9;</xsl:text>
+      <xsl:value-of select="normalize-space(stab_en)"/>
+      <xsl:text>&#9;</xsl:text>
+      <xsl:value-of select="normalize-space(int_solv_en)"/>
+      <xsl:text>&#9;</xsl:text>
+      <xsl:value-of select="normalize-space(pvalue)"/>
+      <xsl:text>&#9;</xsl:text>
+      <xsl:for-each select="molecule">
+        <xsl:value-of select="normalize-space(chain_id)"/>
+        <xsl:if test="position() != last()">
+          <xsl:text> </xsl:text>
+        </xsl:if>
+      </xsl:for-each>
+      <xsl:text>&#10;</xsl:text>
+      <xsl:for-each select="molecule">
+        <xsl:variable name="chain" select="normalize-space(chain_id)"/>
+        <xsl:for-each select="residues/residue">
+          <xsl:text>R&#9;</xsl:text>
+          <xsl:value-of select="$chain"/>
+          <xsl:text>&#9;</xsl:text>
+          <xsl:value-of select="normalize-space(name)"/>
+          <xsl:text>&#9;</xsl:text>
+          <xsl:value-of select="normalize-space(seq_num)"/>
+          <xsl:text>&#9;</xsl:text>
+          <xsl:value-of select="normalize-space(asa)"/>
+          <xsl:text>&#9;</xsl:text>
+          <xsl:value-of select="normalize-space(bsa)"/>
+          <xsl:text>&#9;</xsl:text>
+          <xsl:value-of select="normalize-space(solv_en)"/>
+          <xsl:text>&#10;</xsl:text>
+        </xsl:for-each>
+      </xsl:for-each>
+      <xsl:for-each select="h-bonds/bond">
+        <xsl:text>H&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(chain-1)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(seqnum-1)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(chain-2)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(seqnum-2)"/>
+        <xsl:text>&#10;</xsl:text>
+      </xsl:for-each>
+      <xsl:for-each select="salt-bridges/bond">
+        <xsl:text>S&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(chain-1)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(seqnum-1)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(chain-2)"/>
+        <xsl:text>&#9;</xsl:text>
+        <xsl:value-of select="normalize-space(seqnum-2)"/>
+        <xsl:text>&#10;</xsl:text>
+      </xsl:for-each>
+    </xsl:for-each>
+  </xsl:template>
+</xsl:stylesheet>
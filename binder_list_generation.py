@@ -0,0 +1,31 @@
+import pandas as pd
+
+# The script always runs inside the project directory, so relative
+# filenames are enough
+contacts_path = 'contacts.csv'
+binders_list_path = 'binders_list.txt'
+final_binders_list_path = 'final_binders_list.csv'
+
+# Only the four columns used downstream of the merge
+contacts_df = pd.read_csv(contacts_path, usecols=['binder', 'bsa_score', 'salt_bridges', 'h_bonds'],
+                          engine='pyarrow')
+
+binders_list_df = pd.read_csv(binders_list_path, sep='\t', engine='pyarrow')
+
+# Join on shared category codes instead of python strings; binders with
+# no contact entry fall out of the inner merge either way
+contacts_df['binder'] = contacts_df['binder'].astype('category')
+binders_list_df['description'] = binders_list_df['description'].astype(contacts_df['binder'].dtype)
+
+combined_df = pd.merge(
+    binders_list_df, contacts_df,
+    left_on='description', right_on='binder',
+    how='inner', validate='many_to_one', copy=False,
+)
+combined_df = combined_df.drop(columns='binder')
+
+combined_df.to_csv(final_binders_list_path, index=False)
+
+# Also write Parquet so downstream scripts can load columns zero-copy
+# instead of re-parsing the CSV text
+combined_df.to_parquet('final_binders_list.parquet', compression='zstd', index=False)
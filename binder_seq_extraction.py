@@ -0,0 +1,244 @@
+"""Build binders_list.txt from the AF2 score shards.
+
+Combines the out_*.sc files, keeps designs whose pae_interaction beats
+the cutoff, extracts each binder's chain-A sequence from its predicted
+PDB and writes the annotated table. Python port of the awk pipeline in
+scoring.sh.
+"""
+
+import argparse
+import csv
+import functools
+import io
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+_log = logging.getLogger(__name__)
+
+AF2_PAE_INTERACT = 10.0
+MAX_WORKERS = 48
+
+# Columns carried into binders_list.txt, in output order
+TARGET_COLUMNS = ['binder_aligned_rmsd', 'pae_binder', 'pae_interaction',
+                  'plddt_binder', 'description']
+
+THREE_TO_ONE = {
+    'ALA': 'A', 'ARG': 'R', 'ASN': 'N', 'ASP': 'D', 'CYS': 'C',
+    'GLN': 'Q', 'GLU': 'E', 'GLY': 'G', 'HIS': 'H', 'ILE': 'I',
+    'LEU': 'L', 'LYS': 'K', 'MET': 'M', 'PHE': 'F', 'PRO': 'P',
+    'SER': 'S', 'THR': 'T', 'TRP': 'W', 'TYR': 'Y', 'VAL': 'V',
+}
+
+# Byte-keyed mirror for the raw PDB parser below; the residue field is
+# sliced straight out of the line with no decode or strip
+THREE_TO_ONE_BYTES = {three.encode(): one.encode()
+                      for three, one in THREE_TO_ONE.items()}
+
+# Int-keyed variant: the three residue bytes pack into one small int,
+# so the hot loop hashes an int instead of allocating a bytes slice
+# per ATOM record; values are the one-letter byte values directly
+_PACK_LUT = {(three[0] << 16) | (three[1] << 8) | three[2]: one[0]
+             for three, one in THREE_TO_ONE_BYTES.items()}
+
+# Compiled ATOM-line parser (cythonize -i pdb_seq.pyx); the pure-Python
+# loop below stays as the fallback on nodes without the extension
+try:
+    import pdb_seq
+    pdb_seq.init_table(THREE_TO_ONE_BYTES)
+    _extract_c = pdb_seq.extract_sequence_from_bytes
+except ImportError:
+    _extract_c = None
+
+
+def combine_sc_files(sc_directory):
+    """All SCORE lines of the out_*.sc shards as one prefix-stripped blob.
+
+    Feeds filter_sc_lines directly, so no per-line str list is ever
+    materialized between the stages — one buffer in, one text out.
+    """
+    # scandir filters on the cached entry name without the stat that
+    # iterdir-based listing pays per file
+    entries = [e for e in os.scandir(sc_directory)
+               if e.name.startswith('out_') and e.name.endswith('.sc')]
+    entries.sort(key=lambda e: e.name)
+    # Whole-file reads into one growing buffer, decoded and split once
+    # at the end, instead of a Python str object per line while reading
+    buf = bytearray()
+    for entry in entries:
+        with open(entry.path, 'rb') as fh:
+            buf += fh.read()
+    # The prefix is fixed 6-byte ASCII; a slice compare on the raw
+    # bytes filters before anything is decoded
+    return '\n'.join(line[7:].decode() for line in bytes(buf).split(b'\n')
+                     if line[:6] == b'SCORE:')
+
+
+def filter_sc_lines(combined_text):
+    """Keep entries under the pae_interaction cutoff, projected to TARGET_COLUMNS.
+
+    The split/float work runs in pandas' C tokenizer instead of a
+    Python loop per line; repeated shard headers coerce to NaN and
+    fall out with the cutoff mask.
+    """
+    if not combined_text:
+        return []
+    df = pd.read_csv(io.StringIO(combined_text), sep=r'\s+', engine='c')
+    df['pae_interaction'] = pd.to_numeric(df['pae_interaction'], errors='coerce')
+    df = df[df['pae_interaction'] < AF2_PAE_INTERACT]
+    df = df.sort_values('pae_interaction')
+    # Stay columnar: numeric columns remain packed arrays instead of a
+    # Python list (and later pickle) per row
+    return df[TARGET_COLUMNS].reset_index(drop=True)
+
+
+def extract_sequence(pdb_filename, chain):
+    """One-letter chain sequence from the CA records of a PDB file.
+
+    PDB is a fixed-column format, so the fields are compared as raw
+    byte slices at their known offsets; no per-line decode, strip or
+    str allocation. A leading space at column 13 rules out four-char
+    atom names like HA21 that also contain 'CA'.
+    """
+    with pdb_filename.open('rb') as fh:
+        # The kernel pages the mapping in on demand, so there is no
+        # read-buffer copy and no decode of bytes the filters reject
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return ''
+        with mm:
+            if _extract_c is not None:
+                return _extract_c(mm, chain.encode())
+
+            chain_byte = ord(chain)
+            lut = _PACK_LUT
+            sequence = bytearray()
+            append = sequence.append
+            for line in iter(mm.readline, b''):
+                if not line.startswith(b'ATOM'):
+                    continue
+                if line[13:15] != b'CA' or line[12] != 0x20:
+                    continue
+                if line[21] != chain_byte:
+                    continue
+                # bytes indexing already yields ints, so the key packs
+                # without any slice object
+                key = (line[17] << 16) | (line[18] << 8) | line[19]
+                append(lut.get(key, 0x58))  # 'X'
+            return sequence.decode()
+
+
+def _resolve_pdb_path(description, pdb_directory):
+    """Prediction PDB for a design: working directory first, then pdb_directory."""
+    pdb_filename = Path(f"{description}.pdb")
+    if not pdb_filename.exists():
+        pdb_filename = Path(pdb_directory) / pdb_filename.name
+    if not pdb_filename.exists():
+        return None
+    return pdb_filename
+
+
+def _prefetch_pdb(description, pdb_directory):
+    """Kick off kernel readahead for one design's PDB."""
+    path = _resolve_pdb_path(description, pdb_directory)
+    if path is None:
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # the worker will report the real failure
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_sequence(path_str, mtime_ns, chain):
+    """Per-worker memo so duplicate SC entries parse each PDB once.
+
+    mtime_ns keys out stale hits if a prediction is rewritten mid-run.
+    """
+    return extract_sequence(Path(path_str), chain)
+
+
+def process_pdb_entry(description, pdb_directory, chain='A'):
+    """Binder sequence for one design, or None when it cannot be read."""
+    pdb_filename = _resolve_pdb_path(description, pdb_directory)
+    if pdb_filename is None:
+        _log.debug(f"No PDB file for {description}")
+        return None
+    sequence = _cached_sequence(str(pdb_filename),
+                                pdb_filename.stat().st_mtime_ns, chain)
+    if not sequence:
+        _log.debug(f"No sequence extracted for {description}")
+        return None
+    return sequence
+
+
+def process_pdb_entries_parallel(filtered_entries, pdb_directory,
+                                 output_file='binders_list.txt',
+                                 chain='A', max_workers=MAX_WORKERS):
+    """Extract sequences in parallel and stream the rows to output_file."""
+    # The per-entry work is pure-Python PDB parsing, so threads
+    # serialized on the GIL and max_workers bought nothing; processes
+    # scale with cores. map with a chunksize batches task pickling and
+    # drops the per-future bookkeeping dict. Only the description
+    # string crosses into the workers; the score columns stay in the
+    # parent's packed arrays and rejoin the rows here, relying on
+    # map preserving submission order.
+    # Oversubscribing past the core count only adds scheduling churn
+    # for this CPU-bound stage; honor the setting up to the hardware
+    effective_workers = min(max_workers, os.cpu_count() or 8)
+    if effective_workers != max_workers:
+        _log.info(f"Capping workers at {effective_workers} (requested {max_workers})")
+    max_workers = effective_workers
+    descriptions = filtered_entries['description'].tolist()
+    func = functools.partial(process_pdb_entry, pdb_directory=pdb_directory, chain=chain)
+    chunksize = max(1, len(descriptions) // (max_workers * 8))
+    # The writer is opened once with a large buffer and shared across
+    # the whole run; opening in append mode per completed entry cost an
+    # open/close cycle and a csv.writer construction per row
+    with open(output_file, 'w', newline='', buffering=1 << 20) as fh:
+        writer = csv.writer(fh, delimiter='\t')
+        writer.writerow(TARGET_COLUMNS + ['binder_seq', 'binder_len'])
+        rows = filtered_entries.itertuples(index=False, name=None)
+        # A small thread stage issues fadvise readahead for every PDB
+        # while the process pool works, so the device queue stays full
+        # from I/O depth rather than worker count and parses mostly hit
+        # already-resident pages
+        with ThreadPoolExecutor(max_workers=8) as prefetcher, \
+                ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for description in descriptions:
+                prefetcher.submit(_prefetch_pdb, description, pdb_directory)
+            for row, sequence in zip(rows, executor.map(func, descriptions,
+                                                        chunksize=chunksize)):
+                if sequence is not None:
+                    writer.writerow(row + (sequence, len(sequence)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Filter AF2 scores and extract binder sequences.')
+    parser.add_argument('--sc-directory', default='.')
+    parser.add_argument('--pdb-directory', default='af2_models')
+    parser.add_argument('--output', default='binders_list.txt')
+    parser.add_argument('--chain', default='A')
+    args = parser.parse_args()
+
+    filtered_entries = filter_sc_lines(combine_sc_files(args.sc_directory))
+    if len(filtered_entries) == 0:
+        print(f"No designs passed pae_interaction < {AF2_PAE_INTERACT}.")
+        return
+    process_pdb_entries_parallel(filtered_entries, args.pdb_directory,
+                                 output_file=args.output, chain=args.chain)
+
+
+if __name__ == '__main__':
+    main()
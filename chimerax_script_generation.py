@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Per-model interface/contact block, formatted once per open model
+IFACE_TEMPLATE = """\
+interfaces select #{n}/B contacting #{n}/A bothSides true
+contacts #{n}/A restrict #{n}/B intraMol false
+show sel atoms
+select clear
+"""
+
+# Read the ranked binder list produced by binder_list_generation.py
+data = pd.read_csv('final_binders_list.csv', engine='pyarrow')
+
+# Keep the top 20 models for visual inspection in ChimeraX
+data = data.head(20)
+
+predictions_dir = 'predictions'
+os.makedirs(predictions_dir, exist_ok=True)
+
+binders_cxc_path = 'binders.cxc'
+
+# Enumerate the PDBs once up front so the loops below do O(1) set
+# lookups instead of two stat calls per row
+cwd_pdbs = {entry.name for entry in os.scandir('.') if entry.name.endswith('.pdb')}
+af2_pdbs = {entry.name for entry in os.scandir('af2_models')} if os.path.isdir('af2_models') else set()
+
+# Single pass over the rows: collect the open commands, the numbered
+# interface commands, and the copy list, then write the script at once
+open_lines = []
+iface_lines = []
+copies = []
+for (description,) in data[['description']].itertuples(index=False, name=None):
+    binder_file = description + '.pdb'
+    if binder_file in cwd_pdbs:
+        source = binder_file
+    elif binder_file in af2_pdbs:
+        source = f"af2_models/{binder_file}"
+    else:
+        continue
+    counter = len(open_lines) + 1
+    open_lines.append(f"open {source}\n")
+    iface_lines.append(IFACE_TEMPLATE.format(n=counter))
+    copies.append((source, os.path.join(predictions_dir, binder_file)))
+
+with open(binders_cxc_path, 'w') as file:
+    file.write("set bgcolor white\n")
+    file.write(''.join(open_lines))
+    file.write("""\
+cartoon style protein modeh tube rad 2 sides 24
+cartoon style width 2 thick 0.2
+rainbow chain palette RdYlBu-5
+lighting simple shadows false intensity 0.5
+view all
+hide atoms
+show cartoons
+hide all models
+show #1 models
+matchmaker all to #1/B pairing bs
+""")
+    file.write(''.join(iface_lines))
+    file.write("""\
+delete H
+color byhetero
+""")
+
+# Overlap the PDB copies instead of copying serially inside the row loop
+with ThreadPoolExecutor(max_workers=4) as pool:
+    for source, destination in copies:
+        pool.submit(shutil.copyfile, source, destination)
+
+shutil.copyfile(binders_cxc_path, os.path.join(predictions_dir, 'binders.cxc'))
+
+# Bundle the predictions for emailing/upload; pbzip2 compresses on all
+# cores, keeping the .tar.bz2 name the email step expects
+compressor = 'pbzip2' if shutil.which('pbzip2') else 'bzip2'
+with open('predictions.tar.bz2', 'wb') as archive:
+    tar = subprocess.Popen(['tar', '-cf', '-', predictions_dir], stdout=subprocess.PIPE)
+    subprocess.run([compressor, '-c'], stdin=tar.stdout, stdout=archive, check=True)
+    tar.stdout.close()
+    if tar.wait() != 0:
+        raise RuntimeError(f"tar failed for {predictions_dir}")
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import pickle
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+top50_path = 'top_50_binders_standard.csv'
+final_path = 'final_binders_list.csv'
+
+# Cache the merged table and bar counts keyed by input mtimes so that
+# re-running while tuning plot styling skips the merge entirely
+cache_dir = '.cache'
+os.makedirs(cache_dir, exist_ok=True)
+cache_key = hashlib.md5(
+    f"{os.path.getmtime(top50_path)}:{os.path.getmtime(final_path)}".encode()
+).hexdigest()
+merged_cache = os.path.join(cache_dir, f"merged_{cache_key}.parquet")
+counts_cache = os.path.join(cache_dir, f"counts_{cache_key}.pkl")
+
+if os.path.exists(merged_cache):
+    merged_df = pd.read_parquet(merged_cache)
+else:
+    if os.path.exists('final_binders_list.parquet'):
+        final_df = pd.read_parquet('final_binders_list.parquet')
+    else:
+        final_df = pd.read_csv(final_path, engine='pyarrow')
+    top50_df = pd.read_csv(top50_path, engine='pyarrow')
+    merged_df = pd.merge(final_df, top50_df, on='description', how='inner',
+                         suffixes=('_final', '_top50'))
+    merged_df.to_parquet(merged_cache, compression='zstd')
+
+# argpartition selects the top 50 in O(N) without sorting the whole column
+scores = merged_df['weighted_composite_score'].to_numpy()
+k = min(50, scores.size)
+top_50_indices = merged_df.index[np.argpartition(-scores, k - 1)[:k]]
+
+if os.path.exists(counts_cache):
+    with open(counts_cache, 'rb') as fh:
+        cached_counts = pickle.load(fh)
+else:
+    cached_counts = {}
+
+integer_columns = ['salt_bridges_final', 'h_bonds_final']
+
+
+def plot_bar_with_integers(ax, column):
+    # Bar plot of per-count populations, top 50 binders highlighted
+    if column in cached_counts:
+        all_counts, top_counts = cached_counts[column]
+    else:
+        # bincount gives counts already aligned on 0..max in one C pass,
+        # so no sort_index/reindex round trip is needed
+        arr = merged_df[column].to_numpy()
+        all_counts = np.bincount(arr)
+        top_counts = np.bincount(arr[top_50_indices.to_numpy()], minlength=all_counts.size)
+        cached_counts[column] = (all_counts, top_counts)
+    positions = np.arange(all_counts.size)
+    ax.bar(positions, all_counts, color='lightgray', label='All binders')
+    ax.bar(positions, top_counts, color='crimson', label='Top 50')
+    ax.set_xticks(positions)
+    ax.set_xlabel(column)
+    ax.set_ylabel('count')
+    ax.legend()
+
+
+def plot_scatter(ax, column):
+    # Score against one metric, all binders in gray with the top 50 on top
+    # rasterized keeps the EPS from embedding thousands of vector circles
+    ax.scatter(merged_df[column], merged_df['weighted_composite_score'],
+               s=10, color='lightgray', label='All binders', rasterized=True)
+    ax.scatter(merged_df.loc[top_50_indices, column],
+               merged_df.loc[top_50_indices, 'weighted_composite_score'],
+               s=12, color='crimson', label='Top 50', rasterized=True)
+    ax.set_xlabel(column)
+    ax.set_ylabel('weighted_composite_score')
+    ax.legend()
+
+
+scatter_columns = [
+    column for column in merged_df.select_dtypes(include='number').columns
+    if column != 'weighted_composite_score' and column not in integer_columns
+]
+
+num_plots = len(scatter_columns) + len(integer_columns)
+nrows = -(-num_plots // 2)
+fig, axes = plt.subplots(nrows, 2, figsize=(20, 4 * nrows), constrained_layout=True)
+axes = axes.ravel()
+
+# Remove (not just hide) a trailing unused subplot when num_plots is odd
+for ax in axes[num_plots:]:
+    fig.delaxes(ax)
+axes = axes[:num_plots]
+
+for ax, column in zip(axes, scatter_columns):
+    plot_scatter(ax, column)
+for ax, column in zip(axes[len(scatter_columns):], integer_columns):
+    plot_bar_with_integers(ax, column)
+
+fig.savefig('combined_plots.eps', format='eps', dpi=150)
+
+with open(counts_cache, 'wb') as fh:
+    pickle.dump(cached_counts, fh)
@@ -0,0 +1,37 @@
+import csv
+
+final_binders_path = 'final_binders_list.csv'
+minmax_scaler_path = 'minmax_scaler.csv'
+compared_path = 'compared_binders.csv'
+
+
+def merge_csv_files(binders_path=final_binders_path, scores_path=minmax_scaler_path,
+                    output_path=compared_path):
+    """Join composite scores onto the binder list without materializing either CSV.
+
+    Only the scores file is held in memory (as a plain dict keyed by
+    description); the binder list streams through row by row.
+    """
+    scores = {}
+    with open(scores_path, newline='') as fh:
+        reader = csv.DictReader(fh)
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for row in reader:
+            scores[row['description'].strip().lower()] = row['weighted_composite_score']
+
+    with open(binders_path, newline='') as src, open(output_path, 'w', newline='') as dst:
+        reader = csv.DictReader(src)
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        writer = csv.writer(dst)
+        writer.writerow(['description', 'pae_interaction', 'bsa_score',
+                         'weighted_composite_score'])
+        for row in reader:
+            score = scores.get(row['description'].strip().lower())
+            if score is not None:
+                writer.writerow([row['description'], row['pae_interaction'],
+                                 row['bsa_score'], score])
+    return output_path
+
+
+if __name__ == '__main__':
+    merge_csv_files()
@@ -0,0 +1,45 @@
+import os
+import time
+
+
+def get_disk_io_speed(directory='.', size_mb=128):
+    """Measure sequential write and read speed (MB/s) of a directory's filesystem."""
+    test_path = os.path.join(directory, '.disk_speed_test')
+    buf = b'\0' * (1 << 20)
+    try:
+        # O_DSYNC makes every write hit stable storage, like dd's oflag=dsync
+        fd = os.open(test_path, os.O_WRONLY | os.O_CREAT | os.O_DSYNC, 0o600)
+        try:
+            start = time.perf_counter()
+            for _ in range(size_mb):
+                os.write(fd, buf)
+            os.fsync(fd)
+            write_speed = size_mb / (time.perf_counter() - start)
+        finally:
+            os.close(fd)
+
+        fd = os.open(test_path, os.O_RDONLY)
+        try:
+            # Drop the pages we just wrote so the read is served by the disk
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            start = time.perf_counter()
+            while os.read(fd, 1 << 20):
+                pass
+            read_speed = size_mb / (time.perf_counter() - start)
+        finally:
+            os.close(fd)
+    finally:
+        if os.path.exists(test_path):
+            os.remove(test_path)
+    return write_speed, read_speed
+
+
+def suggested_workers():
+    """Worker count for the parallel analysis stages: one per core, capped at 16."""
+    return min(os.cpu_count() or 1, 16)
+
+
+if __name__ == '__main__':
+    write_speed, read_speed = get_disk_io_speed()
+    print(f"write: {write_speed:.0f} MB/s, read: {read_speed:.0f} MB/s, "
+          f"workers: {suggested_workers()}")
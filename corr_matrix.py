@@ -0,0 +1,31 @@
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+non_numeric = {'description', 'binder', 'binder_seq'}
+
+# Prefer the Parquet copy written by binder_list_generation.py; fall
+# back to sniffing the CSV header so only numeric columns get parsed
+if os.path.exists('final_binders_list.parquet'):
+    df = pd.read_parquet('final_binders_list.parquet')
+    num_cols = [column for column in df.columns if column not in non_numeric]
+    df = df[num_cols].astype(np.float32)
+else:
+    header = pd.read_csv('final_binders_list.csv', nrows=0).columns
+    num_cols = [column for column in header if column not in non_numeric]
+    df = pd.read_csv('final_binders_list.csv', usecols=num_cols, dtype=np.float32,
+                     engine='pyarrow')
+
+# BLAS-backed correlation on the raw array, skipping pandas pairwise dispatch
+corr = np.corrcoef(df.to_numpy(), rowvar=False)
+
+plt.figure(figsize=(10, 8))
+sns.heatmap(pd.DataFrame(corr, index=num_cols, columns=num_cols),
+            annot=True, fmt='.2f', cmap='coolwarm', vmin=-1, vmax=1)
+plt.tight_layout()
+plt.savefig('corr_matrix.png', dpi=300)
@@ -0,0 +1,42 @@
+import argparse
+import os
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Symlink PDB models from one directory into another.')
+    parser.add_argument('source_dir', type=Path)
+    parser.add_argument('target_dir', type=Path)
+    args = parser.parse_args()
+
+    target_dir = args.target_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target_resolve = target_dir.resolve()
+
+    # Plain scandir + symlink loop; the syscall is cheap enough that
+    # thread-pool dispatch would cost more than it saves. Resolve the
+    # source directory once and hold the target open so neither path is
+    # re-walked per file.
+    src_prefix = str(args.source_dir.resolve()) + os.sep
+    with os.scandir(args.source_dir) as entries:
+        pdb_names = [entry.name for entry in entries if entry.name.endswith('.pdb')]
+
+    created = 0
+    skipped = 0
+    target_fd = os.open(str(target_resolve), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name in pdb_names:
+            try:
+                os.symlink(src_prefix + name, name, dir_fd=target_fd)
+                created += 1
+            except FileExistsError:
+                skipped += 1
+    finally:
+        os.close(target_fd)
+
+    print(f"created {created} symlinks in {target_resolve} ({skipped} already present)")
+
+
+if __name__ == '__main__':
+    main()
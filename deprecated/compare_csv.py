@@ -0,0 +1,23 @@
+# Superseded by the streaming implementation in compare_csv.py; kept for
+# reference while the pandas output is still being cross-checked.
+import pandas as pd
+
+
+def merge_csv_files(binders_path='final_binders_list.csv', scores_path='minmax_scaler.csv',
+                    output_path='compared_binders.csv'):
+    df1 = pd.read_csv(binders_path, engine='pyarrow')
+    df2 = pd.read_csv(scores_path, engine='pyarrow')
+
+    df1.rename(columns={c: c.strip().lower() for c in df1.columns}, inplace=True)
+    df2.rename(columns={c: c.strip().lower() for c in df2.columns}, inplace=True)
+
+    merged_df = pd.merge(df1, df2[['description', 'weighted_composite_score']],
+                         on='description')
+    merged_df = merged_df[['description', 'pae_interaction', 'bsa_score',
+                           'weighted_composite_score']]
+    merged_df.to_csv(output_path, index=False)
+    return merged_df
+
+
+if __name__ == '__main__':
+    merge_csv_files()
@@ -0,0 +1,95 @@
+import argparse
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.font_manager as fm
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from utils import get_unique_suffixes
+
+# Simplify vector paths and resolve the label font once per process
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+font_properties = fm.FontProperties(family='sans-serif', size=8)
+
+metrics_to_normalize = ['bsa_score', 'salt_bridges', 'h_bonds', 'binder_aligned_rmsd',
+                        'pae_binder', 'pae_interaction', 'plddt_binder']
+
+# Metrics where a lower value is better get their sign flipped before scaling
+reverse_metrics = ['binder_aligned_rmsd', 'pae_binder', 'pae_interaction']
+
+weights = {
+    'bsa_score': 3.0,
+    'salt_bridges': 2.0,
+    'h_bonds': 2.0,
+    'binder_aligned_rmsd': 1.0,
+    'pae_binder': 1.0,
+    'pae_interaction': 3.0,
+    'plddt_binder': 1.0,
+}
+
+
+def filter_data_by_residue_and_range(data, residue, start, end):
+    """Keep binders whose sequence contains `residue` within positions start..end."""
+    # One in-operator scan per sequence; .str slicing plus .str.contains
+    # would allocate two intermediate Series and run a regex per string
+    seqs = data['binder_seq'].to_numpy()
+    mask = np.fromiter((residue in s[start - 1:end] for s in seqs),
+                       dtype=bool, count=len(seqs))
+    return data[mask]
+
+
+def normalize_and_weight(data):
+    """Sign-flip, weight, and MinMax-scale all metrics in one array pass."""
+    X = data[metrics_to_normalize].to_numpy(dtype=np.float32, copy=True)
+    signs = np.array([-1 if metric in reverse_metrics else 1
+                      for metric in metrics_to_normalize], dtype=np.float32)
+    w = np.array([weights[metric] for metric in metrics_to_normalize], dtype=np.float32)
+    X *= signs * w
+    X -= X.min(0)
+    span = X.max(0)
+    X /= np.where(span > 0, span, 1)
+    data[metrics_to_normalize] = X
+    return data
+
+
+def plot_heatmap(data, output='heatmap_top_50.pdf'):
+    fig, ax = plt.subplots(figsize=(10, 14))
+    sns.heatmap(data[metrics_to_normalize], cmap='viridis', rasterized=True,
+                yticklabels=get_unique_suffixes(data['description'].tolist()), ax=ax)
+    for label in ax.get_yticklabels() + ax.get_xticklabels():
+        label.set_fontproperties(font_properties)
+    fig.savefig(output, dpi=200, bbox_inches='tight')
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Weighted-metric heatmap of the top 50 binders.')
+    parser.add_argument('--residue', help='restrict to binders with this residue')
+    parser.add_argument('--start', type=int, default=1)
+    parser.add_argument('--end', type=int, default=10_000)
+    parser.add_argument('--input', default='final_binders_list.csv')
+    parser.add_argument('--output-csv', default='weighted_binders.csv')
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.input, engine='pyarrow')
+    if args.residue:
+        data = filter_data_by_residue_and_range(data, args.residue, args.start, args.end)
+
+    data = normalize_and_weight(data)
+    data['weighted_score'] = data[metrics_to_normalize].to_numpy().sum(axis=1)
+    data = data.sort_values('weighted_score', ascending=False).head(50)
+
+    plot_heatmap(data)
+    # Rounding up front keeps the fast default serializer; float_format
+    # would route every cell through a Python format callback
+    data[metrics_to_normalize] = data[metrics_to_normalize].round(3)
+    data.to_csv(args.output_csv, index=False, chunksize=50_000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.font_manager as fm
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+
+from utils import get_unique_suffixes
+
+# Simplify vector paths and resolve the label font once per process
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+font_properties = fm.FontProperties(family='sans-serif', size=8)
+
+
+def generate_heatmap(input_csv='weighted_binders.csv', output='heatmap_top_50.pdf'):
+    """Render a heatmap from an already-weighted binder table."""
+    data = pd.read_csv(input_csv)
+    metrics = [column for column in data.columns
+               if column not in ('description', 'binder_seq', 'binder_len', 'weighted_score')]
+    fig, ax = plt.subplots(figsize=(10, 14))
+    sns.heatmap(data[metrics], cmap='viridis', rasterized=True,
+                yticklabels=get_unique_suffixes(data['description'].tolist()), ax=ax)
+    for label in ax.get_yticklabels() + ax.get_xticklabels():
+        label.set_fontproperties(font_properties)
+    fig.savefig(output, dpi=200, bbox_inches='tight')
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    generate_heatmap()
@@ -0,0 +1,169 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from numba import njit
+from sklearn.metrics import silhouette_score
+
+usecols = ['description', 'bsa_score', 'salt_bridges', 'h_bonds',
+           'binder_aligned_rmsd', 'pae_binder', 'pae_interaction', 'plddt_binder']
+dtypes = {
+    'description': pd.CategoricalDtype(),
+    'bsa_score': np.float32,
+    'salt_bridges': np.int16,
+    'h_bonds': np.int16,
+    'binder_aligned_rmsd': np.float32,
+    'pae_binder': np.float32,
+    'pae_interaction': np.float32,
+    'plddt_binder': np.float32,
+}
+
+
+@njit(cache=True, fastmath=True)
+def kmeans2d(X, k, iters=50, seed=42):
+    """Lloyd's k-means on an (n, 2) array with k-means++ seeding."""
+    n = X.shape[0]
+    np.random.seed(seed)
+    centroids = np.empty((k, 2), dtype=X.dtype)
+
+    # k-means++: seed the first centroid at random, then weight the
+    # rest by squared distance to the nearest existing centroid
+    centroids[0] = X[np.random.randint(n)]
+    dist = np.empty(n, dtype=X.dtype)
+    for i in range(n):
+        dx = X[i, 0] - centroids[0, 0]
+        dy = X[i, 1] - centroids[0, 1]
+        dist[i] = dx * dx + dy * dy
+    for c in range(1, k):
+        total = dist.sum()
+        if total <= 0:
+            centroids[c] = X[np.random.randint(n)]
+        else:
+            r = np.random.random() * total
+            acc = 0.0
+            idx = n - 1
+            for i in range(n):
+                acc += dist[i]
+                if acc >= r:
+                    idx = i
+                    break
+            centroids[c] = X[idx]
+        for i in range(n):
+            dx = X[i, 0] - centroids[c, 0]
+            dy = X[i, 1] - centroids[c, 1]
+            d = dx * dx + dy * dy
+            if d < dist[i]:
+                dist[i] = d
+
+    labels = np.zeros(n, dtype=np.int32)
+    sums = np.empty((k, 2), dtype=X.dtype)
+    counts = np.empty(k, dtype=np.int64)
+    for _ in range(iters):
+        changed = False
+        for i in range(n):
+            best = 0
+            best_d = np.inf
+            for c in range(k):
+                dx = X[i, 0] - centroids[c, 0]
+                dy = X[i, 1] - centroids[c, 1]
+                d = dx * dx + dy * dy
+                if d < best_d:
+                    best_d = d
+                    best = c
+            if labels[i] != best:
+                labels[i] = best
+                changed = True
+        if not changed:
+            break
+        sums[:] = 0.0
+        counts[:] = 0
+        for i in range(n):
+            sums[labels[i], 0] += X[i, 0]
+            sums[labels[i], 1] += X[i, 1]
+            counts[labels[i]] += 1
+        for c in range(k):
+            if counts[c] > 0:
+                centroids[c, 0] = sums[c, 0] / counts[c]
+                centroids[c, 1] = sums[c, 1] / counts[c]
+    return labels
+
+
+def analyze_binders(csv_path='merged_binders_contacts.csv'):
+    binders_df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes)
+    binders_df_cleaned = binders_df.dropna()
+
+    features = binders_df_cleaned[['bsa_score', 'salt_bridges']].to_numpy(np.float32)
+    labels = kmeans2d(features, 3)
+    # Score on the two genuine features only (the label column was
+    # leaking in as a third feature) and subsample: the full silhouette
+    # builds an O(n^2) distance matrix
+    silhouette_avg = silhouette_score(features, labels, metric='euclidean',
+                                      sample_size=min(1000, len(features)),
+                                      random_state=42)
+    print(f"Silhouette score: {silhouette_avg:.3f}")
+
+    binders_df_cleaned = binders_df_cleaned.assign(cluster=labels)
+    top_20_binders = binders_df_cleaned.sort_values('bsa_score', ascending=False).head(20)
+
+    # to_dict('records') hands back plain dicts, avoiding the Series
+    # construction per row that iterrows() would pay
+    recs = top_20_binders[['description', 'bsa_score', 'salt_bridges', 'h_bonds',
+                           'binder_aligned_rmsd', 'pae_binder', 'pae_interaction',
+                           'plddt_binder']].to_dict('records')
+    with open('top_20_binders.txt', 'w') as f:
+        f.write(''.join(
+            f"{r['description']}\n"
+            f"BSA Score: {r['bsa_score']}\n"
+            f"Salt Bridges: {r['salt_bridges']}\n"
+            f"H-bonds: {r['h_bonds']}\n"
+            f"RMSD: {r['binder_aligned_rmsd']}\n"
+            f"PAE Binder: {r['pae_binder']}\n"
+            f"PAE Interaction: {r['pae_interaction']}\n"
+            f"pLDDT Binder: {r['plddt_binder']}\n\n"
+            for r in recs))
+
+    return binders_df_cleaned, top_20_binders
+
+
+# One (y-column, label, title, filename) row per scatter plot
+SCATTER_SPECS = [
+    ('salt_bridges', 'Salt Bridges', 'Salt bridges vs BSA score', 'salt_bridges_vs_bsa.png'),
+    ('pae_interaction', 'PAE Interaction', 'PAE interaction vs BSA score', 'pae_vs_bsa.png'),
+    ('plddt_binder', 'pLDDT Binder', 'pLDDT vs BSA score', 'plddt_vs_bsa.png'),
+    ('binder_aligned_rmsd', 'Binder Aligned RMSD', 'RMSD vs BSA score', 'rmsd_vs_bsa.png'),
+]
+
+
+def _scatter_vs_bsa(bsa, clusters, y, top_bsa, top_y, ylabel, title, out):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    points = ax.scatter(bsa, y, c=clusters, cmap='viridis')
+    ax.scatter(top_bsa, top_y, c='red', edgecolor='k', s=150)
+    fig.colorbar(points, ax=ax, label='cluster')
+    ax.set(xlabel='BSA Score', ylabel=ylabel, title=title)
+    fig.savefig(out, dpi=200)
+    plt.close(fig)
+
+
+def generate_cxc_file(output='clusters.cxc'):
+    binders_df_cleaned, top_20_binders = analyze_binders()
+
+    # Materialize the shared columns once; each Series lookup would hand
+    # matplotlib a fresh copy per plot. int8 clusters keep the color
+    # array small (only 3 values).
+    bsa = binders_df_cleaned['bsa_score'].to_numpy()
+    clusters = binders_df_cleaned['cluster'].to_numpy(np.int8)
+    top_bsa = top_20_binders['bsa_score'].to_numpy()
+
+    for ycol, ylabel, title, out in SCATTER_SPECS:
+        _scatter_vs_bsa(bsa, clusters, binders_df_cleaned[ycol].to_numpy(),
+                        top_bsa, top_20_binders[ycol].to_numpy(), ylabel, title, out)
+
+    with open(output, 'w') as f:
+        f.write("set bgcolor white\n")
+        for description in top_20_binders['description']:
+            f.write(f"open {description}.pdb\n")
+
+
+if __name__ == '__main__':
+    generate_cxc_file()
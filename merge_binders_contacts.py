@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+required_binders_columns = ['description', 'binder_aligned_rmsd', 'pae_binder',
+                            'pae_interaction', 'plddt_binder', 'binder_seq', 'binder_len']
+required_contacts_columns = ['binder', 'bsa_score', 'salt_bridges', 'h_bonds']
+
+binders_dtypes = {
+    'description': pd.CategoricalDtype(),
+    'binder_aligned_rmsd': np.float32,
+    'pae_binder': np.float32,
+    'pae_interaction': np.float32,
+    'plddt_binder': np.float32,
+    'binder_len': np.int16,
+}
+contacts_dtypes = {
+    'binder': pd.CategoricalDtype(),
+    'bsa_score': np.float32,
+    'salt_bridges': np.int16,
+    'h_bonds': np.int16,
+}
+
+
+def read_csv_file(path, usecols=None, dtype=None, sep=','):
+    return pd.read_csv(path, usecols=usecols, dtype=dtype, sep=sep)
+
+
+def merge_dataframes(binders_df, contacts_df):
+    # Hash-join on int32 category codes shared between both frames;
+    # merging the keys directly would fall back to Python-string hashing
+    # because their category sets differ
+    cats = pd.Categorical(
+        pd.concat([binders_df['description'].astype(str),
+                   contacts_df['binder'].astype(str)]).unique())
+    binders_df = binders_df.assign(
+        _k=pd.Categorical(binders_df['description'], categories=cats.categories).codes)
+    contacts_df = contacts_df.assign(
+        _k=pd.Categorical(contacts_df['binder'], categories=cats.categories).codes)
+    merged_df = pd.merge(
+        binders_df,
+        contacts_df[['_k', 'bsa_score', 'salt_bridges', 'h_bonds']],
+        on='_k', how='inner')
+    return merged_df.drop(columns='_k')
+
+
+def main():
+    # Restrict both reads to the columns actually used downstream and
+    # land numerics as float32/int16 to halve the frame's footprint
+    binders_df = read_csv_file('binders_list.txt', usecols=required_binders_columns,
+                               dtype=binders_dtypes, sep='\t')
+    contacts_df = read_csv_file('contacts.csv', usecols=required_contacts_columns,
+                                dtype=contacts_dtypes)
+    merged_df = merge_dataframes(binders_df, contacts_df)
+    merged_df.to_csv('merged_binders_contacts.csv', index=False)
+
+
+if __name__ == '__main__':
+    main()
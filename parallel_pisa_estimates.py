@@ -0,0 +1,268 @@
+import logging
+import mmap
+import os
+import queue
+import shlex
+import subprocess
+import threading
+import xml.parsers.expat as expat
+from concurrent.futures import ProcessPoolExecutor
+
+from compute import suggested_workers
+from pisa_core import CHAIN_ID, RESIDUE_COUNTER, bsa_bars
+
+INPUT_DIR = os.environ.get('INPUT_DIR', '.')
+# Final destinations; writing there directly saves a rename per file
+TABLES_DIR = os.environ.get('TABLES_DIR', 'tables')
+XML_DIR = os.environ.get('XML_DIR', 'pisa_xml_files')
+
+BATCH_SIZE = 500
+
+# Every bond section a PISA interfaces dump can carry; only the first
+# two contribute to the tables and counters
+_BOND_SECTIONS = frozenset(
+    ('salt-bridges', 'h-bonds', 'ss-bonds', 'cov-bonds', 'other-bonds'))
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+
+class PISAHandler:
+    """Expat state machine over a PISA interfaces dump.
+
+    The schema is strict and shallow (molecule > residues > residue,
+    interface > salt-bridges/h-bonds > bond), so raw event dispatch
+    collects the same rows and counters as a tree parse without ever
+    allocating an Element.
+    """
+
+    _BOND_HEADER = 'chain_1,res_1,seqnum_1,atname_1,chain_2,res_2,seqnum_2,atname_2,dist\n'
+
+    def __init__(self, chain_id, residue_counter):
+        self.chain_id = chain_id
+        self.residue_counter = residue_counter
+        self.reset()
+
+    def reset(self):
+        """Clear per-document state so one handler can serve many files."""
+        self.sa_rows = ['chain,residue,seq_num,asa,bsa,solv_en\n']
+        self.sb_rows = [self._BOND_HEADER]
+        self.hb_rows = [self._BOND_HEADER]
+        self.total_bsa = 0
+        self.salt_bridges = 0
+        self.h_bonds = 0
+        self._chain = None       # chain_id of the enclosing molecule
+        self._section = None     # which bond section we are inside
+        self._fields = None      # leaf texts of the open residue/bond
+        self._text = []
+
+    def start_element(self, name, attrs):
+        if name == 'residue' or name == 'bond':
+            self._fields = {}
+        elif name in _BOND_SECTIONS:
+            self._section = name
+        self._text = []
+
+    def char_data(self, data):
+        self._text.append(data)
+
+    def end_element(self, name):
+        fields = self._fields
+        if fields is not None:
+            if name == 'residue':
+                self._fields = None
+                seq_num = int(fields['seq_num'])
+                asa = float(fields['asa'])
+                bsa = float(fields['bsa'])
+                self.sa_rows.append(
+                    f"{self._chain},{fields['name']},{seq_num},"
+                    f"{asa:.2f},{bsa:.2f},{float(fields['solv_en']):.2f}\n")
+                if (self._chain == self.chain_id
+                        and seq_num >= self.residue_counter):
+                    self.total_bsa += bsa_bars(asa, bsa)
+            elif name == 'bond':
+                self._fields = None
+                # Dumps also carry ss-bonds/cov-bonds sections; their
+                # bonds must not be counted, matching the tree parser
+                if self._section == 'salt-bridges' or self._section == 'h-bonds':
+                    s1 = int(fields['seqnum-1'])
+                    s2 = int(fields['seqnum-2'])
+                    row = (f"{fields['chain-1']},{fields['res-1']},{s1},{fields['atname-1']},"
+                           f"{fields['chain-2']},{fields['res-2']},{s2},{fields['atname-2']},"
+                           f"{fields['dist']}\n")
+                    hits = ((fields['chain-1'] == self.chain_id and s1 >= self.residue_counter)
+                            + (fields['chain-2'] == self.chain_id and s2 >= self.residue_counter))
+                    if self._section == 'salt-bridges':
+                        self.sb_rows.append(row)
+                        self.salt_bridges += hits
+                    else:
+                        self.hb_rows.append(row)
+                        self.h_bonds += hits
+            else:
+                fields[name] = ''.join(self._text).strip()
+        elif name == 'chain_id':
+            self._chain = ''.join(self._text).strip()
+        self._text = []
+
+
+# Handler built once per worker process by _init_worker; constructing
+# it (and its table buffers) per file showed up on small XMLs
+_worker_handler = None
+
+
+def _init_worker(chain_id=CHAIN_ID, residue_counter=RESIDUE_COUNTER):
+    global _worker_handler
+    _worker_handler = PISAHandler(chain_id, residue_counter)
+
+
+def run_pisa_stage(pdb_paths, xml_dir=XML_DIR, max_workers=None):
+    """Produce the interface XML for every PDB with a single xargs call.
+
+    One xargs fork replaces a Python-scheduled shell per file; xargs
+    keeps max_workers pisa pipelines busy without a scheduling
+    round-trip through the interpreter between files.
+    """
+    if not pdb_paths:
+        return
+    if max_workers is None:
+        max_workers = suggested_workers()
+    manifest = os.path.join(xml_dir, 'pisa_manifest.txt')
+    with open(manifest, 'w') as fh:
+        fh.write('\n'.join(pdb_paths) + '\n')
+    # Each invocation gets a private session directory, so the per-file
+    # `pisa -erase` (a third subprocess per PDB) is unnecessary; the
+    # sessions are swept once after the last batch
+    script = ('export TMPDIR="/dev/shm/pisa_sess_$$"; mkdir -p "$TMPDIR"; '
+              'b=$(basename "$0" .pdb); '
+              'pisa "$0" -analyse "$0" >/dev/null 2>&1'
+              f' && pisa "$0" -xml interfaces >{shlex.quote(xml_dir)}/"$b".xml')
+    subprocess.run(['xargs', '-a', manifest, '-P', str(max_workers), '-n', '1',
+                    'bash', '-c', script], check=False)
+    os.remove(manifest)
+
+
+def process_file(file, chain_id=CHAIN_ID, residue_counter=RESIDUE_COUNTER,
+                 xml_dir=XML_DIR, tables_dir=TABLES_DIR):
+    """Extract per-residue and per-bond interface data from one PDB's XML."""
+    base_filename = os.path.splitext(os.path.basename(file))[0]
+    xml_file = os.path.join(xml_dir, f"{base_filename}.xml")
+
+    if _worker_handler is not None and _worker_handler.chain_id == chain_id \
+            and _worker_handler.residue_counter == residue_counter:
+        handler = _worker_handler
+        handler.reset()
+    else:
+        handler = PISAHandler(chain_id, residue_counter)
+    # expat parsers are single-document by design, so only the parser
+    # object itself is recreated per file
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler = handler.end_element
+    parser.CharacterDataHandler = handler.char_data
+    # Malformed dumps are the rare case; parsing once and catching the
+    # error beats a full validation parse in front of every real parse.
+    # expat takes the mmap buffer directly, so the kernel pages the file
+    # in on demand with no intermediate read copies.
+    try:
+        with open(xml_file, 'rb') as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            parser.Parse(mm, True)
+    except (expat.ExpatError, OSError, ValueError) as exc:
+        logging.warning(f"Could not parse PISA XML for {base_filename}: {exc}")
+        return None
+
+    # Workers hand the finished tables back instead of writing them;
+    # the single writer thread in the parent owns all file I/O, so the
+    # pool never blocks on a slow shared filesystem
+    tables = [(os.path.join(tables_dir, f"{base_filename}_sa.csv"), ''.join(handler.sa_rows)),
+              (os.path.join(tables_dir, f"{base_filename}_salt_bridges.csv"), ''.join(handler.sb_rows)),
+              (os.path.join(tables_dir, f"{base_filename}_hbonds.csv"), ''.join(handler.hb_rows))]
+    contacts_row = (f"{base_filename},{handler.total_bsa},"
+                    f"{handler.salt_bridges},{handler.h_bonds}\n")
+    return contacts_row, tables
+
+
+# (path, payload) work items; path None means the contacts table
+_SENTINEL = None
+
+
+def _writer_thread(work_queue):
+    """Drain the write queue into the CSVs with threshold-based flushing."""
+    contacts_file = open('contacts.csv', 'w', buffering=1 << 20)
+    contacts_file.write('binder,bsa_score,salt_bridges,h_bonds\n')
+    pending = 0
+    try:
+        while True:
+            item = work_queue.get()
+            if item is _SENTINEL:
+                break
+            path, payload = item
+            if path is None:
+                contacts_file.write(payload)
+            else:
+                with open(path, 'w', buffering=1 << 20) as fh:
+                    fh.write(payload)
+            pending += len(payload)
+            # Flush when the queue drains or ~8 MB has accumulated so
+            # contacts.csv stays readable mid-run without a write() per row
+            if pending >= 8 << 20 or work_queue.empty():
+                contacts_file.flush()
+                pending = 0
+    finally:
+        contacts_file.close()
+
+
+def process_files_in_batches(files_to_process, batch_size=BATCH_SIZE, max_workers=None):
+    if max_workers is None:
+        max_workers = suggested_workers()
+
+    work_queue = queue.Queue(maxsize=4096)
+    writer = threading.Thread(target=_writer_thread, args=(work_queue,))
+    writer.start()
+    try:
+        for start in range(0, len(files_to_process), batch_size):
+            batch = [os.path.join(INPUT_DIR, name)
+                     for name in files_to_process[start:start + batch_size]]
+            # Stage 1: all PISA runs for the batch in one xargs call
+            run_pisa_stage(batch, max_workers=max_workers)
+            # Stage 2: parse-only pool over the produced XMLs.
+            # The XML parse after PISA returns is CPU-bound pure Python,
+            # so a process pool is required to get past the GIL; batch
+            # the map to amortize IPC
+            chunksize = max(1, len(batch) // (max_workers * 4))
+            contacts_rows = []
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker) as executor:
+                for result in executor.map(process_file, batch, chunksize=chunksize):
+                    if result is None:
+                        continue
+                    contacts_row, tables = result
+                    for path, payload in tables:
+                        work_queue.put((path, payload))
+                    contacts_rows.append(contacts_row)
+            # One joined contacts payload per batch instead of a queue
+            # item (and downstream write) per PDB
+            if contacts_rows:
+                work_queue.put((None, ''.join(contacts_rows)))
+    finally:
+        work_queue.put(_SENTINEL)
+        writer.join()
+        # One sweep of the per-invocation PISA session state
+        subprocess.run(['bash', '-c', 'rm -rf /dev/shm/pisa_sess_*'], check=False)
+
+
+def main():
+    os.makedirs(TABLES_DIR, exist_ok=True)
+    os.makedirs(XML_DIR, exist_ok=True)
+    # scandir streams DirEntry objects with cached names; listdir on a
+    # directory with thousands of predictions is noticeably slower on
+    # the cluster filesystems
+    with os.scandir(INPUT_DIR) as it:
+        files_to_process = [entry.name for entry in it
+                            if entry.name.endswith('_af2pred.pdb')
+                            and entry.name.startswith('rfdiff_design_')]
+    process_files_in_batches(files_to_process)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""C-level CA-sequence extraction for binder_seq_extraction.py.
+
+Build in place with `cythonize -i pdb_seq.pyx`; the caller falls back
+to the pure-Python parser when the extension is absent.
+"""
+
+from libc.string cimport memchr, memset
+
+# One-letter codes indexed by the packed 3-letter residue name
+# (base-26 over A..Z); zero means unknown and maps to 'X'
+cdef unsigned char _LUT[26 * 26 * 26]
+memset(_LUT, 0, sizeof(_LUT))
+
+
+def init_table(dict three_to_one_bytes):
+    """Fill the packed lookup table from THREE_TO_ONE_BYTES."""
+    cdef bytes three, one
+    cdef int a, b, c
+    for three, one in three_to_one_bytes.items():
+        a = three[0] - 65
+        b = three[1] - 65
+        c = three[2] - 65
+        if 0 <= a < 26 and 0 <= b < 26 and 0 <= c < 26:
+            _LUT[a * 676 + b * 26 + c] = one[0]
+
+
+def extract_sequence_from_bytes(const unsigned char[:] data, bytes chain):
+    """One-letter sequence of `chain` from a whole PDB file in memory."""
+    cdef Py_ssize_t n = data.shape[0]
+    cdef const unsigned char* buf = &data[0] if n else NULL
+    cdef const unsigned char* nl
+    cdef Py_ssize_t pos = 0, eol
+    cdef unsigned char chain_c = chain[0]
+    cdef unsigned char code
+    cdef int a, b, c
+    cdef bytearray out = bytearray()
+
+    while pos < n:
+        nl = <const unsigned char*>memchr(buf + pos, 0x0A, n - pos)
+        eol = (nl - buf) if nl != NULL else n
+        # ATOM + ' CA ' atom name + chain at their fixed columns
+        if (eol - pos >= 22
+                and buf[pos] == 0x41 and buf[pos + 1] == 0x54
+                and buf[pos + 2] == 0x4F and buf[pos + 3] == 0x4D
+                and buf[pos + 12] == 0x20
+                and buf[pos + 13] == 0x43 and buf[pos + 14] == 0x41
+                and buf[pos + 21] == chain_c):
+            a = buf[pos + 17] - 65
+            b = buf[pos + 18] - 65
+            c = buf[pos + 19] - 65
+            code = 0
+            if 0 <= a < 26 and 0 <= b < 26 and 0 <= c < 26:
+                code = _LUT[a * 676 + b * 26 + c]
+            out.append(code if code else 0x58)  # 'X'
+        pos = eol + 1
+    return bytes(out).decode('ascii')
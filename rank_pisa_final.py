@@ -0,0 +1,150 @@
+"""Rank binders by a composite z-score over the PISA interface metrics.
+
+Reads contacts.csv (optionally annotated with an overlap yes/no
+column), derives the interface quality metrics, scores each binder as
+a weighted sum of column z-scores and writes the ranked table plus a
+heatmap of the top candidates.
+"""
+
+import argparse
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from numba import njit, prange
+
+from utils import get_unique_suffixes, read_cached_csv, write_csv
+
+# Metrics entering the composite score, with their weights; higher is
+# better for every derived column
+SCORE_COLUMNS = ['interface_area', 'interactions', 'good_dg', 'good_solv',
+                 'specificity', 'dg_per_100A2']
+SCORE_WEIGHTS = [1.0, 2.0, 2.0, 1.0, 1.0, 2.0]
+
+NUMERIC_COLUMNS = ['bsa_score', 'salt_bridges', 'h_bonds', 'interface_area',
+                   'stabilization_energy', 'solvation_energy', 'specificity']
+
+OVERLAP_YES = {'yes', 'y', 'true', '1'}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _score_kernel(X, mu, sd, w):
+    # Standardization and weighted sum in one fused loop: each element
+    # is touched once and no Z temporary the size of X is allocated
+    n = X.shape[0]
+    k = X.shape[1]
+    out = np.zeros(n)
+    for i in prange(n):
+        s = 0.0
+        for j in range(k):
+            v = X[i, j]
+            if not np.isnan(v):
+                s += w[j] * (v - mu[j]) / sd[j]
+        out[i] = s
+    return out
+
+
+def compute_scores(df):
+    """Composite score over the standardized metric block.
+
+    The six columns go through NumPy as a single (N, 6) float64 array;
+    one nanmean/nanstd pass gives the column stats and the compiled
+    kernel folds standardization and the weighted sum into one
+    SIMD-friendly pass across rows.
+    """
+    X = np.ascontiguousarray(df[SCORE_COLUMNS].to_numpy(dtype=np.float64))
+    mu = np.nanmean(X, axis=0)
+    sd = np.nanstd(X, axis=0)
+    sd[(sd == 0) | ~np.isfinite(sd)] = 1.0
+    w = np.asarray(SCORE_WEIGHTS, dtype=np.float64)
+    return _score_kernel(X, mu, sd, w / w.sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rank binders by weighted PISA interface metrics.')
+    parser.add_argument('--input', default='contacts.csv')
+    parser.add_argument('--output', default='ranked_binders.csv')
+    parser.add_argument('--top-n', type=int, default=50)
+    parser.add_argument('--outdir', default='.')
+    args = parser.parse_args()
+
+    # The arrow engine parses multi-threaded, and declaring the types
+    # up front skips both inference and a second-pass to_numeric over
+    # every column; empty fields land as NaN
+    df = read_cached_csv(args.input, engine='pyarrow',
+                         dtype={column: np.float64 for column in NUMERIC_COLUMNS})
+
+    # Derived quality metrics: more contacts, more favorable (negative)
+    # energies and higher specificity all push the score up. Computed
+    # as raw ndarrays and assigned in one go, so no per-column Series
+    # temporaries or index alignments
+    sb = df['salt_bridges'].to_numpy()
+    hb = df['h_bonds'].to_numpy()
+    good_dg = -df['stabilization_energy'].to_numpy()
+    good_solv = -df['solvation_energy'].to_numpy()
+    denom = df['interface_area'].to_numpy() / 100.0
+    denom = np.where(denom == 0, np.nan, denom)
+    df = df.assign(interactions=np.nan_to_num(sb) + np.nan_to_num(hb),
+                   good_dg=good_dg, good_solv=good_solv,
+                   dg_per_100A2=good_dg / denom)
+
+    df['score'] = compute_scores(df)
+
+    ranked = df.sort_values('score', ascending=False)
+    ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+    write_csv(ranked, args.output)
+
+    # Binders flagged as overlapping a blocked epitope stay in the
+    # ranked CSV but are excluded from the top-candidate heatmap
+    if 'overlap' in ranked.columns:
+        # As a categorical, the strip/lower normalization touches only
+        # the handful of distinct category labels, not all N rows.
+        # The yes-test runs on the categories and maps back through the
+        # codes; renaming the categories instead would raise whenever
+        # two raw labels normalize to the same string
+        overlap = ranked['overlap'].astype(str).astype('category')
+        yes_category = (overlap.cat.categories.str.strip().str.lower()
+                        .isin(OVERLAP_YES))
+        overlap_flag = yes_category.to_numpy()[overlap.cat.codes]
+        ranked_no_overlap = ranked[~overlap_flag]
+    else:
+        ranked_no_overlap = ranked
+
+    # A view is enough: nothing below mutates the top slice
+    top = ranked_no_overlap.iloc[:int(args.top_n)]
+    if len(top) == 0:
+        print('No binders left after the overlap filter; skipping heatmap.')
+        return
+
+    # One broadcast standardization over the whole matrix; a per-column
+    # apply would re-enter Python (and re-coerce) once per metric.
+    # Every heat column is already float64 from the typed read and the
+    # derived-column block, so this is a plain extraction, not a coercion
+    heat_cols = SCORE_COLUMNS
+    A = top[heat_cols].to_numpy(dtype=np.float64)
+    mu = np.nanmean(A, axis=0)
+    sd = np.nanstd(A, axis=0)
+    sd[(sd == 0) | ~np.isfinite(sd)] = 1.0
+    Az = np.where(np.isnan(A), 0.0, (A - mu) / sd)
+
+    fig, ax = plt.subplots(figsize=(8, max(4, 0.2 * len(top))),
+                           constrained_layout=True)
+    # float32 halves the bandwidth into the renderer; rasterized makes
+    # the PDF embed the image instead of one vector shape per cell
+    im = ax.imshow(Az.astype(np.float32), aspect='auto', cmap='viridis',
+                   interpolation='nearest', rasterized=True)
+    fig.colorbar(im, ax=ax, label='column z-score')
+    ax.set_xticks(range(len(heat_cols)), heat_cols, rotation=45, ha='right')
+    ax.set_yticks(range(len(top)), get_unique_suffixes(top['binder'].tolist()),
+                  fontsize=6)
+    outdir = Path(args.outdir)
+    fig.savefig(outdir / 'top_candidates_heatmap.png', dpi=150)
+    fig.savefig(outdir / 'top_candidates_heatmap.pdf', dpi=200)
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
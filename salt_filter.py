@@ -0,0 +1,55 @@
+"""Filter the combined score file down to designs with qualifying salt bridges.
+
+Reads the PDB ids from qualifying_salt_bridges.csv and keeps only the
+matching rows of out.sc.
+"""
+
+import argparse
+
+import pandas as pd
+
+
+def load_pdb_ids(salt_bridges_file):
+    """Frozenset of PDB ids listed in the qualifying salt bridges CSV.
+
+    usecols pushes the projection into the parser, so the other
+    columns are never allocated; frozenset gives the cheapest possible
+    __contains__ for the isin probe downstream.
+    """
+    ids = pd.read_csv(salt_bridges_file, usecols=['PDB_ID'],
+                      dtype='string')['PDB_ID']
+    return frozenset(ids.str.strip())
+
+
+def filter_sc_file(out_sc_file, pdb_ids, output_file='filtered_out.sc'):
+    """Keep the rows of the score file whose description is in pdb_ids.
+
+    The pandas C tokenizer splits the whitespace table and isin does
+    the membership test as one hash probe pass at C level, instead of
+    strip/split and a set lookup per Python line. The SCORE: prefix
+    simply parses as the first column and is written back unchanged.
+    Reading in chunks bounds memory at one chunk however large the
+    score file gets, and interleaves the reads with the filtering.
+    """
+    with open(output_file, 'w') as out:
+        chunks = pd.read_csv(out_sc_file, sep=r'\s+', engine='c',
+                             chunksize=200_000)
+        for i, chunk in enumerate(chunks):
+            chunk[chunk['description'].isin(pdb_ids)].to_csv(
+                out, sep=' ', header=(i == 0), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Restrict out.sc to designs with qualifying salt bridges.')
+    parser.add_argument('--salt-bridges', default='qualifying_salt_bridges.csv')
+    parser.add_argument('--sc-file', default='out.sc')
+    parser.add_argument('--output', default='filtered_out.sc')
+    args = parser.parse_args()
+
+    pdb_ids = load_pdb_ids(args.salt_bridges)
+    filter_sc_file(args.sc_file, pdb_ids, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Merge the top-50 tables from both scales and plot their agreement.
+
+Joins the standard- and min-max-scaled top-50 CSVs from scaler.py on
+the design description, writes the combined table and a scatter plot
+of one composite score against the other with the best designs
+labeled.
+"""
+
+import argparse
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from utils import read_cached_csv, write_csv
+
+
+def merge_csv_files(standard_path, minmax_path, debug=False):
+    """Inner-join the two top-50 tables on description."""
+    df1 = read_cached_csv(standard_path)
+    df2 = read_cached_csv(minmax_path)
+
+    # The explicit duplicate report costs an extra O(N) scan per frame,
+    # so it only runs on request; validate reuses the merge's own hash
+    # table to fail fast on duplicate keys either way
+    if debug:
+        for name, df in (('standard', df1), ('minmax', df2)):
+            counts = df['description'].value_counts()
+            duplicated = counts[counts > 1]
+            if len(duplicated):
+                print(f"Duplicate descriptions in the {name} table:")
+                print(duplicated.index.tolist())
+
+    # The merge copies every payload column of both frames, so the
+    # projection to the four output columns happens before the join
+    # rather than after
+    df1 = df1[['description', 'binder_seq', 'weighted_composite_score']] \
+        .rename(columns={'weighted_composite_score': 'standard_scale_score'})
+    df2 = df2[['description', 'weighted_composite_score']] \
+        .rename(columns={'weighted_composite_score': 'minmax_scale_score'})
+    return pd.merge(df1, df2, on='description', how='inner',
+                    validate='one_to_one', copy=False)
+
+
+def add_labels(data):
+    """Short numeric labels from the design descriptions.
+
+    One vectorized extractall pulls every digit group for the whole
+    column at once; a per-row apply would re-enter Python (and the
+    regex engine setup) for each description.
+    """
+    matches = data['description'].astype(str).str.extractall(r'(\d+)')[0] \
+        .unstack(level='match').reindex(data.index)
+    label = matches[0].fillna('') if 0 in matches else pd.Series('', index=data.index)
+    if 1 in matches:
+        second = matches[1]
+        label = label + np.where(second.notna(), '_' + second.fillna(''), '')
+    data['label'] = label
+    return data
+
+
+def generate_scatter_plot(data, top_n=5, output='top_binders_scatter.png'):
+    """Standard against min-max composite score, best designs labeled."""
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.scatter(data['standard_scale_score'], data['minmax_scale_score'],
+               s=12, color='lightgray')
+
+    top = data.nlargest(top_n, 'standard_scale_score')
+    ax.scatter(top['standard_scale_score'], top['minmax_scale_score'],
+               s=16, color='crimson')
+
+    # Candidate annotation offsets around each point; collisions with
+    # already-placed labels are found with one KD-tree ball query over
+    # all eight candidates at once instead of a linear scan of
+    # used_positions per candidate
+    offsets = np.array([(10, 10), (-10, 10), (10, -10), (-10, -10),
+                        (15, 0), (-15, 0), (0, 15), (0, -15)], dtype=np.float64)
+    used_positions = []
+    for row in top.itertuples(index=False):
+        point = np.array([row.standard_scale_score, row.minmax_scale_score])
+        candidates = point + offsets * 0.001
+        if used_positions:
+            tree = cKDTree(np.asarray(used_positions))
+            hits = tree.query_ball_point(candidates, r=0.005, p=np.inf)
+            counts = np.fromiter((len(h) for h in hits), dtype=np.intp,
+                                 count=len(candidates))
+            # First collision-free offset, else the least crowded one
+            free = np.flatnonzero(counts == 0)
+            pick = free[0] if free.size else int(np.argmin(counts))
+        else:
+            pick = 0
+        dx, dy = offsets[pick]
+        ax.annotate(row.label, (point[0], point[1]), xytext=(dx, dy),
+                    textcoords='offset points', fontsize=7)
+        used_positions.append(candidates[pick])
+
+    ax.set_xlabel('standard_scale_score')
+    ax.set_ylabel('minmax_scale_score')
+    fig.savefig(output, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Combine and plot the top binders from both scales.')
+    parser.add_argument('--standard', default='top_50_binders_standard.csv')
+    parser.add_argument('--minmax', default='top_50_binders_minmax.csv')
+    parser.add_argument('--output', default='top_binders.csv')
+    parser.add_argument('--top-n', type=int, default=5)
+    args = parser.parse_args()
+
+    merged_df = merge_csv_files(args.standard, args.minmax)
+    merged_df = add_labels(merged_df)
+    write_csv(merged_df, args.output)
+    generate_scatter_plot(merged_df, top_n=args.top_n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+
+def read_cached_csv(path, **read_csv_kwargs):
+    """Read a CSV through a sibling Parquet cache.
+
+    A fresh .parquet next to the file skips re-tokenizing the text on
+    repeat runs; otherwise the CSV is parsed once and the cache
+    written for next time.
+    """
+    path = Path(path)
+    cache = path.with_suffix('.parquet')
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(cache)
+    df = pd.read_csv(path, **read_csv_kwargs)
+    try:
+        df.to_parquet(cache)
+    except (ImportError, ValueError, OSError):
+        pass  # no parquet engine or unwritable directory; just skip caching
+    return df
+
+
+def write_csv(df, path):
+    """Write a DataFrame as CSV through Arrow's multi-threaded writer.
+
+    pandas' to_csv formats floats through Python when a format is set;
+    the Arrow writer keeps everything in typed C++ formatters. Round
+    columns beforehand if fixed precision is wanted.
+    """
+    pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path),
+                 write_options=pv.WriteOptions(include_header=True))
+
+
+def get_unique_suffixes(labels):
+    """Shorten design names to the underscore-separated parts that differ."""
+    splits = [label.split('_') for label in labels]
+    keep = [column for column in zip(*splits) if len(set(column)) > 1]
+    return ['_'.join(parts) for parts in zip(*keep)] if keep else [''] * len(labels)